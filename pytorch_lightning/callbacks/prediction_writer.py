@@ -43,6 +43,11 @@ class BasePredictionWriter(Callback):
     """
     Base class to implement how the predictions should be stored.
 
+    :meth:`write_on_batch_end` receives the predictions as returned by ``predict_step``, on the device they were
+    computed on. :meth:`write_on_epoch_end` receives the stored predictions, whose CUDA tensors have been moved to
+    the CPU, into pinned memory if the dataloader uses ``pin_memory=True``. Tensors on other devices, e.g., TPUs or
+    IPUs, are passed unchanged to both.
+
     Args:
         write_interval: When to write.
 
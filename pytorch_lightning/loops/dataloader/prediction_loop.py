@@ -50,7 +50,7 @@ class PredictionLoop(DataLoaderLoop):
         # return dl1, dl2
         dataloaders = self.dataloaders
         length = len(dataloaders)
-        if len(dataloaders) > 0 and isinstance(dataloaders[0], (list, tuple)):
+        if length > 0 and isinstance(dataloaders[0], (list, tuple)):
             length = len(dataloaders[0])
         return length
 
@@ -1,12 +1,14 @@
 from collections import OrderedDict
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import torch
 from deprecate import void
 
 import pytorch_lightning as pl
 from pytorch_lightning.loops.base import Loop
 from pytorch_lightning.overrides.distributed import IndexBatchSamplerWrapper
 from pytorch_lightning.trainer.progress import EpochProgress
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.warnings import WarningCache
 
 
@@ -21,9 +23,12 @@ class PredictionEpochLoop(Loop):
         self.progress = EpochProgress()
 
         self._dl_max_batches: Optional[int] = None
-        self._num_dataloaders: Optional[int] = None
         self._warning_cache = WarningCache()
         self._all_batch_indices: List[int] = []
+        self._pending_copies: Dict[torch.device, torch.cuda.Event] = {}
+        self._should_store_predictions: bool = False
+        self._pass_dataloader_idx: bool = False
+        self._pin_predictions: bool = False
 
     def connect(
         self, trainer: "pl.Trainer", *args: Any, progress: Optional[EpochProgress] = None, **kwargs: Any
@@ -49,6 +54,7 @@ class PredictionEpochLoop(Loop):
         self.iteration_count = 0
         self._all_batch_indices: List[int] = []
         self.predictions: List[Any] = []
+        self._pending_copies = {}
 
     def on_run_start(
         self,
@@ -68,10 +74,15 @@ class PredictionEpochLoop(Loop):
             num_dataloaders: the total number of dataloaders
             return_predictions: whether to return the obtained predictions
         """
-        void(dataloader_iter, dataloader_idx)
+        void(dataloader_iter)
         self._dl_max_batches = dl_max_batches
-        self._num_dataloaders = num_dataloaders
+        # ``predict_step`` only receives the ``dataloader_idx`` when there are multiple dataloaders
+        self._pass_dataloader_idx = num_dataloaders > 1
         self.return_predictions = return_predictions
+        # evaluated once per dataloader as it requires a scan over all callbacks
+        self._should_store_predictions = self.should_store_predictions
+        # the pinned memory stays locked as long as the predictions are kept, so the dataloader has to opt into it
+        self._pin_predictions = getattr(self.trainer.predict_dataloaders[dataloader_idx], "pin_memory", False)
 
     def advance(
         self,
@@ -103,6 +114,9 @@ class PredictionEpochLoop(Loop):
 
     def on_run_end(self) -> Tuple[Any, Any]:
         """Returns the predictions and the corresponding batch indices"""
+        # wait for the asynchronous copies of the last predictions to the host to finish
+        self._complete_pending_copies()
+
         predictions = self.predictions
         all_batch_indices = self._all_batch_indices
         # free memory
@@ -137,8 +151,45 @@ class PredictionEpochLoop(Loop):
 
         self.trainer.call_hook("on_predict_batch_end", predictions, batch, batch_idx, dataloader_idx)
 
-        if self.should_store_predictions:
-            self.predictions.append(predictions)
+        if self._should_store_predictions:
+            self.predictions.append(self._move_predictions_to_cpu(predictions))
+
+    def _move_predictions_to_cpu(self, predictions: Any) -> Any:
+        """
+        Moves all CUDA tensors in the predictions to the CPU, copying every tensor once into its own memory.
+        Tensors on other devices are left untouched. If the dataloader uses ``pin_memory=True``, dense tensors are
+        copied to pinned host memory without blocking the host and the copies are only waited for once all batches
+        of the dataloader ran.
+
+        Args:
+            predictions: the outputs of the current predict step
+        """
+        devices = set()
+
+        def to_cpu(tensor: torch.Tensor) -> torch.Tensor:
+            if not tensor.is_cuda:
+                return tensor
+            if not self._pin_predictions or tensor.layout != torch.strided:
+                # sparse tensors can't be copied into dense pinned memory
+                return tensor.cpu()
+            devices.add(tensor.device)
+            return torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True).copy_(tensor, non_blocking=True)
+
+        if isinstance(predictions, torch.Tensor):
+            # fast path for the common case of a single tensor per batch
+            predictions = to_cpu(predictions)
+        else:
+            predictions = apply_to_collection(predictions, torch.Tensor, to_cpu)
+        for device in devices:
+            # the copies are ordered on the stream, so waiting for the last one of each device is enough
+            self._pending_copies[device] = torch.cuda.current_stream(device).record_event()
+        return predictions
+
+    def _complete_pending_copies(self) -> None:
+        """Waits for the scheduled copies of the predictions to the host to finish"""
+        for event in self._pending_copies.values():
+            event.synchronize()
+        self._pending_copies = {}
 
     def _build_kwargs(self, batch: Any, batch_idx: int, dataloader_idx: int) -> Dict[str, Any]:
         """
@@ -153,7 +204,7 @@ class PredictionEpochLoop(Loop):
             the dictionary containing all the keyboard arguments for the predict step
         """
         step_kwargs = OrderedDict([('batch', batch), ('batch_idx', batch_idx)])
-        if self._num_dataloaders > 1:
+        if self._pass_dataloader_idx:
             step_kwargs['dataloader_idx'] = dataloader_idx
         return step_kwargs
 
@@ -162,5 +213,5 @@ class PredictionEpochLoop(Loop):
         batch_sampler = self.trainer.predict_dataloaders[dataloader_idx].batch_sampler
         if isinstance(batch_sampler, IndexBatchSamplerWrapper):
             self.current_batch_indices = batch_sampler.batch_indices
-            if self.should_store_predictions:
+            if self._should_store_predictions:
                 self._all_batch_indices.append(batch_sampler.batch_indices)
@@ -13,14 +13,18 @@
 # limitations under the License.
 import numbers
 import warnings
-from typing import Any
+from collections import defaultdict, OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 
 import torch
+from torch.nn import DataParallel, Module
+from torch.nn.parallel import comm
+from torch.nn.parallel.replicate import _replicatable_module
 
 import pytorch_lightning as pl
 from pytorch_lightning.overrides.base import _LightningModuleWrapperBase
-from pytorch_lightning.utilities import rank_zero_warn
-from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities import rank_zero_deprecation, rank_zero_warn
+from pytorch_lightning.utilities.apply_func import _walk_collection, apply_to_collection
 
 
 def _ignore_scalar_return_in_dp():
@@ -62,16 +66,30 @@ class LightningParallelModule(_LightningModuleWrapperBase):
         # forward call will redirect to training_step, validation_step, etc.
         output = super().forward(*inputs, **kwargs)
 
+        scalars: List[numbers.Number] = []
+
         def output_transform(data: Any):
-            data = python_scalar_to_tensor(data, self.module.device)
-            data = unsqueeze_scalar_tensor(data)
+            if isinstance(data, torch.Tensor):
+                return data.unsqueeze(0) if data.dim() == 0 else data
+            # Python scalars are converted all at once below
+            scalars.append(data)
             return data
 
         output = apply_to_collection(
             output,
-            dtype=(numbers.Number, torch.Tensor),
+            # tensors and the builtin scalar types (including ``bool``) are matched before the comparatively slow
+            # ``numbers.Number`` check, which is only reached by collections and other leaves
+            dtype=(torch.Tensor, int, float, numbers.Number),
             function=output_transform,
         )
+        if scalars:
+            # only outputs containing Python scalars are traversed a second time
+            scalar_tensors = python_scalars_to_tensors(scalars, self.module.device)
+            output = apply_to_collection(
+                output,
+                dtype=(int, float, numbers.Number),
+                function=lambda data: next(scalar_tensors[type(data)]),
+            )
         return output
 
     def update_replica_device_attributes(self, inputs: Any) -> None:
@@ -85,19 +103,14 @@ class LightningParallelModule(_LightningModuleWrapperBase):
             inputs: A collection of inputs (typically a tuple). If the inputs don't contain tensors,
                 a warning is shown that accessing ``self.device`` will not return the correct device.
         """
-        replica_device = None
-
-        def find_tensor_with_device(tensor: torch.Tensor) -> torch.Tensor:
-            nonlocal replica_device
-            if replica_device is None and tensor.device != torch.device("cpu"):
-                replica_device = tensor.device
-            return tensor
-
-        apply_to_collection(inputs, dtype=torch.Tensor, function=find_tensor_with_device)
+        # the first tensor that is not on the CPU tells on which device this replica runs
+        tensors = _walk_collection(inputs, dtype=torch.Tensor)
+        replica_device = next((t.device for t in tensors if t.device != torch.device("cpu")), None)
 
         if replica_device is not None:
-            # by calling .to() we force the update to the self.device property
-            self.module.to(device=replica_device)
+            if replica_device != self.module.device:
+                # by calling .to() we force the update to the self.device property
+                self.module.to(device=replica_device)
         else:
             rank_zero_warn(
                 "Could not determine on which device the inputs are."
@@ -106,15 +119,137 @@ class LightningParallelModule(_LightningModuleWrapperBase):
             )
 
 
+class LightningCachedDataParallel(DataParallel):
+    """
+    A :class:`~torch.nn.parallel.DataParallel` that reuses the parameters and buffers broadcast to the devices
+    across forward calls while gradients are disabled and the module is in evaluation mode, e.g., during
+    validation, testing and prediction. Without gradients, the copies are not part of any autograd graph, so the
+    same copies can serve every batch until the weights change. With gradients enabled or in training mode, the
+    replicas are created on every call exactly as in :class:`~torch.nn.parallel.DataParallel`.
+
+    Only the tensors are cached. The module replicas themselves are rebuilt from the current state of the wrapped
+    module on every call in the same way as :func:`~torch.nn.parallel.replicate` builds them, so attributes set on
+    the module between batches reach the replicas and attributes set on a replica during the forward pass are
+    discarded, as in :class:`~torch.nn.parallel.DataParallel`.
+
+    The copies are broadcast again whenever a parameter or buffer of the wrapped module has been replaced or modified
+    in-place since the last broadcast, as detected by its version counter. This covers optimizer steps, loading a
+    checkpoint and buffers updated by the forward pass on the root device. Changes that bypass the version counter,
+    e.g., writes to ``tensor.data``, are not detected: call :meth:`invalidate_replicas` after them. Modules which
+    :func:`~torch.nn.parallel.replicate` can not replicate, e.g., Python modules within a ``ScriptModule``, are never
+    cached. Call :meth:`invalidate_replicas` as well when the cached copies are no longer needed to free the memory
+    they occupy on the devices.
+
+    Example:
+
+        dp_model = LightningCachedDataParallel(
+            module=LightningParallelModule(lightning_module),
+            device_ids=[3, 4],
+            ...
+        )
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._broadcast_sources: Optional[List[torch.Tensor]] = None
+        self._broadcast_versions: Optional[List[int]] = None
+        self._broadcast_copies: Optional[List[List[torch.Tensor]]] = None
+
+    def replicate(self, module: Module, device_ids: Sequence[Union[int, torch.device]]) -> List[Module]:
+        modules = list(module.modules())
+        if (
+            torch.is_grad_enabled() or module.training
+            or any(isinstance(m, torch.jit.ScriptModule) for m in modules) or not _replicatable_module(module)
+        ):
+            # replicas created with gradients enabled belong to the autograd graph of the current step
+            self.invalidate_replicas()
+            return super().replicate(module, device_ids)
+
+        sources = list(module.parameters()) + list(module.buffers())
+        if not self._has_broadcast_copies(sources, len(device_ids)):
+            # broadcast to all devices once, a smaller batch may only be scattered to some of them
+            self._broadcast_sources = sources
+            self._broadcast_versions = [t._version for t in sources]
+            self._broadcast_copies = comm.broadcast_coalesced(sources, self.device_ids)
+
+        module_indices = {m: i for i, m in enumerate(modules)}
+        source_indices = {t: i for i, t in enumerate(sources)}
+        replicas = []
+        for copies in self._broadcast_copies[:len(device_ids)]:
+            module_copies = [m._replicate_for_data_parallel() for m in modules]
+            for m, replica in zip(modules, module_copies):
+                # exposes the replicated parameters to ``DistributedDataParallel`` as in ``torch.nn.parallel.replicate``
+                replica._former_parameters = OrderedDict()
+                for key, child in m._modules.items():
+                    replica._modules[key] = None if child is None else module_copies[module_indices[child]]
+                for key, param in m._parameters.items():
+                    if param is None:
+                        replica._parameters[key] = None
+                    else:
+                        # parameters in replicas are no longer leaves, so they are set as plain attributes
+                        setattr(replica, key, copies[source_indices[param]])
+                        replica._former_parameters[key] = copies[source_indices[param]]
+                for key, buf in m._buffers.items():
+                    replica._buffers[key] = None if buf is None else copies[source_indices[buf]]
+            replicas.append(module_copies[0])
+        return replicas
+
+    def invalidate_replicas(self) -> None:
+        """Drops the cached copies so that the next forward call broadcasts the module's tensors again."""
+        self._broadcast_sources = None
+        self._broadcast_versions = None
+        self._broadcast_copies = None
+
+    def _has_broadcast_copies(self, sources: List[torch.Tensor], num_devices: int) -> bool:
+        # the cache is stale if a parameter or buffer of the module has been replaced or modified in-place
+        return (
+            self._broadcast_copies is not None and len(self._broadcast_copies) >= num_devices
+            and len(self._broadcast_sources) == len(sources) and all(
+                cached is source and version == source._version
+                for cached, version, source in zip(self._broadcast_sources, self._broadcast_versions, sources)
+            )
+        )
+
+
 def python_scalar_to_tensor(data: Any, device: torch.device = torch.device("cpu")) -> Any:
-    """ Converts a Python scalar number to a torch tensor and places it on the given device. """
+    """
+    Converts a Python scalar number to a torch tensor and places it on the given device.
+
+    .. deprecated:: v1.4
+        Use :func:`python_scalars_to_tensors` instead. Will be removed in v1.6.
+    """
+    rank_zero_deprecation(
+        "`python_scalar_to_tensor` is deprecated in v1.4 and will be removed in v1.6."
+        " Use `python_scalars_to_tensors` instead."
+    )
     if isinstance(data, numbers.Number):
         data = torch.tensor([data], device=device)
     return data
 
 
+def python_scalars_to_tensors(data: Any, device: torch.device = torch.device("cpu")) -> Dict[type, Iterator[Any]]:
+    """
+    Converts all Python scalar numbers in a collection to tensors on the given device, using a single
+    host-to-device copy per scalar type instead of one per number.
+
+    Returns:
+        A mapping from the scalar type to an iterator over the converted 1-dim tensors, in the order in which
+        :func:`~pytorch_lightning.utilities.apply_func.apply_to_collection` visits the scalars of that type.
+    """
+    scalars = defaultdict(list)
+    for scalar in _walk_collection(data, numbers.Number):
+        scalars[type(scalar)].append(scalar)
+    return {scalar_type: iter(torch.tensor(values, device=device).split(1)) for scalar_type, values in scalars.items()}
+
+
 def unsqueeze_scalar_tensor(data: Any) -> Any:
-    """ Un-squeezes a 0-dim tensor. """
+    """
+    Un-squeezes a 0-dim tensor.
+
+    .. deprecated:: v1.4
+        Will be removed in v1.6.
+    """
+    rank_zero_deprecation("`unsqueeze_scalar_tensor` is deprecated in v1.4 and will be removed in v1.6.")
     if isinstance(data, torch.Tensor) and data.dim() == 0:
         data = data.unsqueeze(0)
     return data
@@ -11,12 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import torch
-from torch.nn import DataParallel
+from torch.optim import Optimizer
 
-from pytorch_lightning.overrides.data_parallel import LightningParallelModule
+from pytorch_lightning.overrides.data_parallel import LightningCachedDataParallel, LightningParallelModule
 from pytorch_lightning.plugins.training_type.parallel import ParallelPlugin
 from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.model_helpers import is_overridden
@@ -51,7 +51,7 @@ class DataParallelPlugin(ParallelPlugin):
     def setup(self, model):
         # model needs to be moved to the device before it is wrapped
         model.to(self.root_device)
-        self._model = DataParallel(LightningParallelModule(model), self.parallel_devices)
+        self._model = LightningCachedDataParallel(LightningParallelModule(model), self.parallel_devices)
 
     def reduce(self, collection: _METRIC_COLLECTION, *args, **kwargs) -> _METRIC_COLLECTION:
         """
@@ -89,6 +89,33 @@ class DataParallelPlugin(ParallelPlugin):
     def reduce_boolean_decision(self, decision: bool) -> bool:
         return decision
 
+    def post_optimizer_step(self, optimizer: Optimizer, optimizer_idx: int, **kwargs: Any) -> None:
+        self._invalidate_replicas()
+
+    def on_validation_start(self) -> None:
+        self._invalidate_replicas()
+
+    def on_test_start(self) -> None:
+        self._invalidate_replicas()
+
+    def on_predict_start(self) -> None:
+        self._invalidate_replicas()
+
+    def on_validation_end(self) -> None:
+        # free the cached copies on the non-root devices
+        self._invalidate_replicas()
+
+    def on_test_end(self) -> None:
+        self._invalidate_replicas()
+
+    def on_predict_end(self) -> None:
+        self._invalidate_replicas()
+
+    def _invalidate_replicas(self) -> None:
+        # the weights may have changed since the copies were cached, e.g. by an optimizer step or a checkpoint
+        if isinstance(self._model, LightningCachedDataParallel):
+            self._model.invalidate_replicas()
+
     def training_step(self, *args, **kwargs):
         return self.model(*args, **kwargs)
 
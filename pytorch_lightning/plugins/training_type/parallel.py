@@ -23,7 +23,7 @@ import pytorch_lightning as pl
 from pytorch_lightning.overrides.base import unwrap_lightning_module
 from pytorch_lightning.plugins.environments.cluster_environment import ClusterEnvironment
 from pytorch_lightning.plugins.training_type.training_type_plugin import TrainingTypePlugin
-from pytorch_lightning.utilities import _XLA_AVAILABLE
+from pytorch_lightning.utilities import _XLA_AVAILABLE, rank_zero_warn
 from pytorch_lightning.utilities.distributed import all_gather_ddp_if_available, ReduceOp
 
 
@@ -101,6 +101,11 @@ class ParallelPlugin(TrainingTypePlugin, ABC):
         torch_backend = os.getenv("PL_TORCH_DISTRIBUTED_BACKEND")
         if torch_backend is None:
             torch_backend = "nccl" if self.on_gpu else "gloo"
+        elif torch_backend == "gloo" and self.on_gpu:
+            rank_zero_warn(
+                "You set `PL_TORCH_DISTRIBUTED_BACKEND=gloo` while training on GPUs. The `nccl` backend"
+                " communicates directly between GPUs and is usually much faster. Unset the variable to use it."
+            )
         return torch_backend
 
     @staticmethod
@@ -542,6 +542,15 @@ class AcceleratorConnector(object):
                 cluster_environment=self.cluster_environment,
             )
         elif self.use_dp:
+            # with a single device, `DataParallel` runs the module directly without scattering the batches
+            if len(self.parallel_devices) > 1:
+                rank_zero_warn(
+                    "`accelerator='dp'` runs in a single process and scatters/gathers every batch through the root"
+                    " GPU, which makes it considerably slower than `accelerator='ddp'` or `accelerator='ddp_spawn'`."
+                    " If your model uses all of its parameters in every step, consider"
+                    " `Trainer(accelerator='ddp', plugins='ddp_find_unused_parameters_false')` for the best"
+                    " performance."
+                )
             plugin = DataParallelPlugin(parallel_devices=self.parallel_devices)
         elif self.use_horovod:
             plugin = HorovodPlugin(parallel_devices=self.parallel_devices)
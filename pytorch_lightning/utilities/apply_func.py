@@ -18,7 +18,7 @@ from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from copy import copy
 from functools import partial
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 import numpy as np
 import torch
@@ -128,6 +128,36 @@ def apply_to_collection(
     return data
 
 
+def _walk_collection(
+    data: Any, dtype: Union[type, tuple], wrong_dtype: Optional[Union[type, tuple]] = None
+) -> Iterator[Any]:
+    """
+    Iterates over all elements of a certain dtype in a collection, in the same order in which
+    :func:`apply_to_collection` visits them. Unlike :func:`apply_to_collection`, the collection is walked with an
+    explicit stack and never rebuilt, and the iteration can be stopped early. Prefer it for read-only traversals.
+
+    Args:
+        data: the collection to iterate over
+        dtype: the elements of this dtype will be yielded
+        wrong_dtype: the elements won't be yielded if this type is specified and the given element
+            is of the ``wrong_dtype`` even if it is of type ``dtype``
+
+    Returns:
+        An iterator over the elements of the given dtype
+    """
+    stack = [data]
+    while stack:
+        data = stack.pop()
+        if isinstance(data, dtype) and (wrong_dtype is None or not isinstance(data, wrong_dtype)):
+            yield data
+        elif isinstance(data, Mapping):
+            stack.extend(reversed(list(data.values())))
+        elif isinstance(data, Sequence) and not isinstance(data, str):
+            stack.extend(reversed(data))
+        elif _is_dataclass_instance(data):
+            stack.extend(getattr(data, field) for field in reversed(list(data.__dataclass_fields__)))
+
+
 def apply_to_collections(
     data1: Optional[Any],
     data2: Optional[Any],
@@ -26,6 +26,7 @@ from pytorch_lightning.accelerators.cpu import CPUAccelerator
 from pytorch_lightning.accelerators.gpu import GPUAccelerator
 from pytorch_lightning.callbacks import Callback
 from pytorch_lightning.plugins import (
+    DataParallelPlugin,
     DDP2Plugin,
     DDPPlugin,
     DDPShardedPlugin,
@@ -66,6 +67,23 @@ def test_accelerator_choice_ddp_cpu(tmpdir):
     assert isinstance(trainer.training_type_plugin.cluster_environment, LightningEnvironment)
 
 
+@mock.patch('torch.cuda.device_count', return_value=2)
+@mock.patch('torch.cuda.is_available', return_value=True)
+def test_accelerator_choice_dp_warns_about_performance(cuda_available_mock, device_count_mock):
+    with pytest.warns(UserWarning, match="considerably slower than `accelerator='ddp'`"):
+        trainer = Trainer(fast_dev_run=True, accelerator='dp', gpus=2)
+    assert isinstance(trainer.training_type_plugin, DataParallelPlugin)
+
+
+@mock.patch('torch.cuda.device_count', return_value=2)
+@mock.patch('torch.cuda.is_available', return_value=True)
+def test_accelerator_choice_dp_single_gpu_does_not_warn(cuda_available_mock, device_count_mock):
+    with pytest.warns(None) as record:
+        trainer = Trainer(fast_dev_run=True, accelerator='dp', gpus=1)
+    assert isinstance(trainer.training_type_plugin, DataParallelPlugin)
+    assert not any("considerably slower than `accelerator='ddp'`" in str(w.message) for w in record)
+
+
 @mock.patch.dict(os.environ, {"CUDA_VISIBLE_DEVICES": "0,1"})
 @mock.patch('torch.cuda.device_count', return_value=2)
 @mock.patch('torch.cuda.is_available', return_value=True)
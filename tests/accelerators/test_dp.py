@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from unittest import mock
+
 import pytest
 import torch
 import torch.nn.functional as F
@@ -22,6 +24,8 @@ import tests.helpers.utils as tutils
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import EarlyStopping
 from pytorch_lightning.core import memory
+from pytorch_lightning.overrides.data_parallel import LightningCachedDataParallel
+from pytorch_lightning.plugins import DataParallelPlugin
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel, RandomDataset
 from tests.helpers.datamodules import ClassifDataModule
@@ -203,3 +207,72 @@ def test_dp_training_step_dict(tmpdir):
         accelerator='dp',
     )
     trainer.fit(model)
+
+
+@pytest.mark.parametrize(
+    "hook, args", [
+        ("post_optimizer_step", (None, 0)),
+        ("on_validation_start", ()),
+        ("on_validation_end", ()),
+        ("on_test_start", ()),
+        ("on_test_end", ()),
+        ("on_predict_start", ()),
+        ("on_predict_end", ()),
+    ]
+)
+def test_dp_plugin_invalidates_replicas(hook, args):
+    """ Test that the plugin drops the cached DataParallel copies when the weights change or a run ends. """
+    plugin = DataParallelPlugin(parallel_devices=[torch.device("cuda", 0), torch.device("cuda", 1)])
+    plugin._model = mock.Mock(spec=LightningCachedDataParallel)
+
+    getattr(plugin, hook)(*args)
+    plugin._model.invalidate_replicas.assert_called_once()
+
+
+@RunIf(min_gpus=2)
+def test_dp_frees_cached_copies_after_evaluation(tmpdir):
+    """ Test that the copies cached by DP during evaluation are freed once the evaluation ends. """
+
+    class CheckCacheCallback(pl.Callback):
+
+        def on_validation_batch_end(self, trainer, *_):
+            assert trainer.training_type_plugin.model._broadcast_copies is not None
+
+    model = BoringModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        gpus=2,
+        accelerator='dp',
+        callbacks=CheckCacheCallback(),
+    )
+    trainer.fit(model)
+    assert trainer.training_type_plugin.model._broadcast_copies is None
+
+    trainer.validate(model)
+    assert trainer.training_type_plugin.model._broadcast_copies is None
+
+
+@RunIf(min_gpus=2)
+def test_dp_logging_with_multiple_val_dataloaders(tmpdir):
+    """ Test that the metrics logged by the DP replicas are filed under the current dataloader index. """
+
+    class TestModel(BoringModel):
+
+        def validation_step(self, batch, batch_idx, dataloader_idx):
+            self.log("idx", float(dataloader_idx))
+            return super().validation_step(batch, batch_idx)
+
+        def val_dataloader(self):
+            return [DataLoader(RandomDataset(32, 64), batch_size=4) for _ in range(2)]
+
+    model = TestModel()
+    model.validation_epoch_end = None
+    trainer = Trainer(default_root_dir=tmpdir, limit_val_batches=2, gpus=2, accelerator='dp')
+    trainer.validate(model)
+
+    metrics = trainer.callback_metrics
+    assert metrics["idx/dataloader_idx_0"] == 0
+    assert metrics["idx/dataloader_idx_1"] == 1
@@ -13,11 +13,13 @@
 # limitations under the License.
 """ Test deprecated functionality which will be removed in v1.6.0 """
 import pytest
+import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 from pytorch_lightning.core.memory import ModelSummary
+from pytorch_lightning.overrides.data_parallel import python_scalar_to_tensor, unsqueeze_scalar_tensor
 from pytorch_lightning.plugins.training_type import DDPPlugin, DDPSpawnPlugin
 from pytorch_lightning.utilities.distributed import rank_zero_deprecation, rank_zero_warn
 from pytorch_lightning.utilities.model_helpers import is_overridden
@@ -309,3 +311,11 @@ def test_v1_6_0_deprecated_disable_validation():
 def test_v1_6_0_every_n_val_epochs():
     with pytest.deprecated_call(match="use `every_n_epochs` instead"):
         _ = ModelCheckpoint(every_n_val_epochs=1)
+
+
+def test_v1_6_0_deprecated_dp_scalar_utilities():
+    with pytest.deprecated_call(match="`python_scalar_to_tensor` is deprecated in v1.4"):
+        python_scalar_to_tensor(1.0)
+
+    with pytest.deprecated_call(match="`unsqueeze_scalar_tensor` is deprecated in v1.4"):
+        unsqueeze_scalar_tensor(torch.tensor(1.0))
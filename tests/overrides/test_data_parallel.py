@@ -11,22 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from unittest.mock import MagicMock, Mock
+from unittest import mock
 
 import pytest
 import torch
 import torch.nn as nn
 from torch.nn import DataParallel
+from torch.nn.parallel import comm
 
 from pytorch_lightning import LightningModule
 from pytorch_lightning.core.decorators import auto_move_data
 from pytorch_lightning.overrides import LightningDistributedModule
 from pytorch_lightning.overrides.data_parallel import (
+    LightningCachedDataParallel,
     LightningParallelModule,
     python_scalar_to_tensor,
     unsqueeze_scalar_tensor,
 )
 from pytorch_lightning.trainer.states import RunningStage
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from tests.helpers import BoringModel
 from tests.helpers.runif import RunIf
 
@@ -45,7 +48,7 @@ from tests.helpers.runif import RunIf
 )
 def test_lightning_wrapper_module_methods(wrapper_class, stage):
     """ Test that the LightningWrapper redirects .forward() to the LightningModule methods. """
-    pl_module = MagicMock()
+    pl_module = mock.MagicMock()
     wrapped_module = wrapper_class(pl_module)
 
     batch = torch.rand(5)
@@ -70,7 +73,8 @@ def test_lightning_wrapper_module_methods(wrapper_class, stage):
 )
 def test_unsqueeze_scalar_tensor(inp, expected):
     """ Test that the utility function unsqueezes only scalar tensors. """
-    assert torch.all(unsqueeze_scalar_tensor(inp).eq(expected))
+    with pytest.deprecated_call(match="`unsqueeze_scalar_tensor` is deprecated in v1.4"):
+        assert torch.all(unsqueeze_scalar_tensor(inp).eq(expected))
 
 
 @RunIf(min_gpus=2)
@@ -88,7 +92,7 @@ def test_lightning_parallel_module_unsqueeze_scalar():
             return {"loss": loss}
 
     model = TestModel()
-    model.trainer = Mock()
+    model.trainer = mock.Mock()
     model.trainer.state.stage = RunningStage.TRAINING
     batch = torch.rand(2, 32).cuda()
     batch_idx = 0
@@ -114,7 +118,8 @@ def test_lightning_parallel_module_unsqueeze_scalar():
     ]
 )
 def test_python_scalar_to_tensor(inp, expected):
-    assert torch.all(python_scalar_to_tensor(inp).eq(expected))
+    with pytest.deprecated_call(match="`python_scalar_to_tensor` is deprecated in v1.4"):
+        assert torch.all(python_scalar_to_tensor(inp).eq(expected))
 
 
 @RunIf(min_gpus=1)
@@ -131,7 +136,7 @@ def test_lightning_parallel_module_python_scalar_conversion(device):
             return output
 
     model = TestModel().to(device)
-    model.trainer = Mock()
+    model.trainer = mock.Mock()
     model.trainer.state.stage = RunningStage.TRAINING
     batch = torch.rand(2, 32).to(device)
     batch_idx = 0
@@ -141,6 +146,52 @@ def test_lightning_parallel_module_python_scalar_conversion(device):
     assert output["python scalar"] == torch.tensor([12.3], device=device)
 
 
+def test_lightning_parallel_module_python_scalar_conversion_mixed_types():
+    """ Test that LightningParallelModule converts Python scalars of different types within one output. """
+
+    class TestModel(BoringModel):
+
+        def training_step(self, batch, batch_idx):
+            return {"loss": torch.tensor(1.0), "int": 1, "float": 2.5, "bool": True, "nested": [3, (4.5, False)]}
+
+    model = TestModel()
+    model.trainer = mock.Mock()
+    model.trainer.state.stage = RunningStage.TRAINING
+    batch = torch.rand(2, 32)
+
+    output = LightningParallelModule(model)(batch, 0)
+    pairs = [
+        (output["loss"], torch.tensor([1.0])),
+        (output["int"], torch.tensor([1])),
+        (output["float"], torch.tensor([2.5])),
+        (output["bool"], torch.tensor([True])),
+        (output["nested"][0], torch.tensor([3])),
+        (output["nested"][1][0], torch.tensor([4.5])),
+        (output["nested"][1][1], torch.tensor([False])),
+    ]
+    for actual, expected in pairs:
+        assert actual.dtype == expected.dtype
+        assert torch.equal(actual, expected)
+
+
+def test_lightning_parallel_module_single_pass_without_python_scalars():
+    """ Test that outputs without Python scalars are traversed only once. """
+    model = BoringModel()
+    model.trainer = mock.Mock()
+    model.trainer.state.stage = RunningStage.TRAINING
+    batch = torch.rand(2, 32)
+
+    with mock.patch(
+        "pytorch_lightning.overrides.data_parallel.apply_to_collection", wraps=apply_to_collection
+    ) as apply_mock, mock.patch(
+        "pytorch_lightning.overrides.data_parallel.python_scalars_to_tensors"
+    ) as scalars_mock:
+        output = LightningParallelModule(model)(batch, 0)
+    assert apply_mock.call_count == 1
+    scalars_mock.assert_not_called()
+    assert output["loss"].dim() == 1
+
+
 @RunIf(min_gpus=2)
 @pytest.mark.parametrize(
     "nest, unnest", [
@@ -168,7 +219,7 @@ def test_lightning_parallel_module_device_access(nest, unnest):
 
     pl_module = DeviceAccessModel()
     # required for redirecting the forward call to training_step
-    pl_module.trainer = Mock()
+    pl_module.trainer = mock.Mock()
     pl_module.trainer.state.stage = RunningStage.TRAINING
 
     root_device = torch.device("cuda", 0)
@@ -184,6 +235,30 @@ def test_lightning_parallel_module_device_access(nest, unnest):
     assert torch.all(output.cpu().eq(torch.tensor([1, 1])))
 
 
+@RunIf(min_gpus=1)
+def test_lightning_parallel_module_device_update_skipped_on_same_device():
+    """ Test that the replica's device attributes are only updated when the device of the inputs differs. """
+    pl_module = BoringModel().cuda()
+    wrapped_module = LightningParallelModule(pl_module)
+
+    with mock.patch.object(pl_module, "to", wraps=pl_module.to) as to_mock:
+        wrapped_module.update_replica_device_attributes((torch.rand(1, device=pl_module.device), ))
+    to_mock.assert_not_called()
+
+
+@RunIf(min_gpus=2)
+def test_lightning_parallel_module_device_update_on_different_device():
+    """ Test that the replica's device attributes are updated when the inputs are on another device. """
+    pl_module = BoringModel().cuda(0)
+    wrapped_module = LightningParallelModule(pl_module)
+    device = torch.device("cuda", 1)
+
+    with mock.patch.object(pl_module, "to", wraps=pl_module.to) as to_mock:
+        wrapped_module.update_replica_device_attributes((torch.rand(1, device=device), ))
+    to_mock.assert_called_once_with(device=device)
+    assert pl_module.device == device
+
+
 @RunIf(min_gpus=2)
 def test_lightning_parallel_module_device_access_warning():
     """ Test that we show a warning when the device can't be inferred from the input. """
@@ -195,7 +270,7 @@ def test_lightning_parallel_module_device_access_warning():
 
     pl_module = DeviceAccessModel()
     # required for redirecting the forward call to training_step
-    pl_module.trainer = Mock()
+    pl_module.trainer = mock.Mock()
     pl_module.trainer.state.stage = RunningStage.TRAINING
 
     wrapped_module = LightningParallelModule(pl_module).cuda()
@@ -204,3 +279,59 @@ def test_lightning_parallel_module_device_access_warning():
     data = dict(x=1)  # contains no tensors
     with pytest.warns(UserWarning, match="Could not determine on which device the inputs are."):
         _ = model(data, 0)
+
+
+@RunIf(min_gpus=2)
+def test_lightning_cached_data_parallel_reuses_broadcast_without_grad():
+    """ Test that the broadcast copies are only reused in eval mode without gradients and until invalidated. """
+    pl_module = BoringModel()
+    model = LightningCachedDataParallel(LightningParallelModule(pl_module).cuda(), device_ids=[0, 1])
+    batch = torch.rand(4, 32).cuda()
+    broadcast_coalesced = comm.broadcast_coalesced
+
+    with mock.patch.object(comm, "broadcast_coalesced", side_effect=broadcast_coalesced) as broadcast_mock:
+        model.eval()
+        with torch.no_grad():
+            model(batch)
+            model(batch)
+        assert broadcast_mock.call_count == 1
+
+        model.invalidate_replicas()
+        with torch.no_grad():
+            model(batch)
+        assert broadcast_mock.call_count == 2
+
+        # in-place changes, e.g. by ``load_state_dict``, are detected through the version counter
+        state_dict = {k: v + 1 for k, v in pl_module.state_dict().items()}
+        pl_module.load_state_dict(state_dict)
+        with torch.no_grad():
+            output = model(batch)
+        assert broadcast_mock.call_count == 3
+        assert torch.allclose(output, pl_module(batch))
+
+        model.train()
+        with torch.no_grad():
+            model(batch)
+        assert model._broadcast_copies is None
+
+
+@RunIf(min_gpus=2)
+def test_lightning_cached_data_parallel_rebuilds_replicas_from_current_state():
+    """ Test that the replicas see the attributes of the module at the time of the call, but not each other's. """
+
+    class TestModel(BoringModel):
+
+        def forward(self, x):
+            assert getattr(self, "leaked", None) is None
+            self.leaked = self.marker
+            return x.new_full((x.shape[0], 1), self.marker)
+
+    pl_module = TestModel()
+    model = LightningCachedDataParallel(pl_module.cuda(), device_ids=[0, 1]).eval()
+    batch = torch.rand(4, 32).cuda()
+
+    with torch.no_grad():
+        for marker in (1.0, 2.0):
+            pl_module.marker = marker
+            assert torch.all(model(batch) == marker)
+    assert model._broadcast_copies is not None
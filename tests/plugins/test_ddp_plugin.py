@@ -11,13 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 from unittest import mock
 
+import pytest
 import torch
 from torch.nn.parallel import DistributedDataParallel
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.plugins import DDPPlugin
+from pytorch_lightning.plugins import DDP2Plugin, DDPPlugin, DDPSpawnPlugin
 from tests.helpers.boring_model import BoringModel
 from tests.helpers.runif import RunIf
 
@@ -76,3 +78,22 @@ def test_ddp_barrier_non_consecutive_device_ids(barrier_mock, tmpdir):
     )
     trainer.fit(model)
     barrier_mock.assert_any_call(device_ids=[gpus[trainer.local_rank]])
+
+
+@pytest.mark.parametrize("plugin_cls", [DDPPlugin, DDP2Plugin, DDPSpawnPlugin])
+@pytest.mark.parametrize(["ddp_kwargs", "expected_bucket_cap_mb"], [({}, 50), ({"bucket_cap_mb": 10}, 10)])
+def test_ddp_default_bucket_cap_mb(plugin_cls, ddp_kwargs, expected_bucket_cap_mb):
+    """Test that the DDP plugins default to larger gradient buckets unless the user sets ``bucket_cap_mb``."""
+    plugin = plugin_cls(**ddp_kwargs)
+    with mock.patch.object(plugin_cls, "lightning_module", new_callable=mock.PropertyMock):
+        plugin.pre_configure_ddp()
+    assert plugin._ddp_kwargs["bucket_cap_mb"] == expected_bucket_cap_mb
+
+
+@mock.patch("torch.cuda.is_available", return_value=True)
+@mock.patch.dict(os.environ, {"PL_TORCH_DISTRIBUTED_BACKEND": "gloo"})
+def test_ddp_gloo_backend_on_gpu_warns(_):
+    """Test that selecting the gloo backend while training on GPUs points the user to nccl."""
+    plugin = DDPPlugin(parallel_devices=[torch.device("cuda", 0)])
+    with pytest.warns(UserWarning, match="`nccl` backend"):
+        assert plugin.torch_distributed_backend == "gloo"
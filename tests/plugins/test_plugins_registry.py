@@ -14,7 +14,13 @@
 import pytest
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.plugins import DDPPlugin, DeepSpeedPlugin, TPUSpawnPlugin, TrainingTypePluginsRegistry
+from pytorch_lightning.plugins import (
+    DDPPlugin,
+    DDPSpawnPlugin,
+    DeepSpeedPlugin,
+    TPUSpawnPlugin,
+    TrainingTypePluginsRegistry,
+)
 from tests.helpers.runif import RunIf
 
 
@@ -86,14 +92,23 @@ def test_deepspeed_training_type_plugins_registry_with_trainer(tmpdir, plugin):
     assert isinstance(trainer.training_type_plugin, DeepSpeedPlugin)
 
 
-def test_ddp_training_type_plugins_registry_with_trainer(tmpdir):
+@pytest.mark.parametrize(
+    "plugin_name, plugin",
+    [
+        ("ddp_find_unused_parameters_false", DDPPlugin),
+        ("ddp_spawn_find_unused_parameters_false", DDPSpawnPlugin),
+    ],
+)
+def test_ddp_training_type_plugins_registry_with_trainer(tmpdir, plugin_name, plugin):
+
+    assert TrainingTypePluginsRegistry[plugin_name]["init_params"] == {"find_unused_parameters": False}
 
     trainer = Trainer(
         default_root_dir=tmpdir,
-        plugins="ddp_find_unused_parameters_false",
+        plugins=plugin_name,
     )
 
-    assert isinstance(trainer.training_type_plugin, DDPPlugin)
+    assert isinstance(trainer.training_type_plugin, plugin)
 
 
 def test_tpu_spawn_debug_plugins_registry(tmpdir):
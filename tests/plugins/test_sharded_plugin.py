@@ -319,3 +319,19 @@ def test_ddp_sharded_plugin_manual_optimization(tmpdir):
         gpus=2,
     )
     trainer.fit(model)
+
+
+@RunIf(fairscale=True)
+@pytest.mark.parametrize("plugin_cls", [DDPShardedPlugin, DDPSpawnShardedPlugin])
+def test_block_backward_sync(tmpdir, plugin_cls):
+    """
+        Test to ensure that the sharded plugins skip the gradient sync via ``no_sync``
+    """
+    from fairscale.nn.data_parallel.sharded_ddp import ShardedDataParallel
+
+    plugin = plugin_cls()
+    model = mock.MagicMock(spec=ShardedDataParallel)
+    with mock.patch.object(plugin_cls, "model", new_callable=mock.PropertyMock, return_value=model):
+        with plugin.block_backward_sync():
+            pass
+    model.no_sync.assert_called_once()
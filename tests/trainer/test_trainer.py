@@ -38,6 +38,7 @@ from pytorch_lightning.overrides.distributed import IndexBatchSamplerWrapper, Un
 from pytorch_lightning.plugins import DDPSpawnPlugin
 from pytorch_lightning.trainer.states import TrainerFn
 from pytorch_lightning.utilities import DeviceType, DistributedType
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.exceptions import DeadlockDetectedException, MisconfigurationException
 from pytorch_lightning.utilities.seed import seed_everything
@@ -1433,6 +1434,8 @@ def predict(
         assert len(results) == 2
         assert len(results[0]) == num_samples
         assert results[0][0].shape == torch.Size([1, 2])
+        # the predictions are moved to the host as they are collected
+        assert results[0][0].device.type == "cpu"
 
 
 def test_trainer_predict_no_return(tmpdir):
@@ -1493,6 +1496,58 @@ def test_trainer_predict_1_gpu(tmpdir):
     predict(tmpdir, None, 1, None)
 
 
+@RunIf(min_gpus=1)
+@pytest.mark.parametrize("pin_memory", [False, True])
+def test_trainer_predict_moves_predictions_to_cpu(tmpdir, pin_memory):
+
+    class CustomBoringModel(BoringModel):
+
+        def predict_step(self, batch, batch_idx, dataloader_idx=None):
+            output = super().predict_step(batch, batch_idx, dataloader_idx)
+            return {
+                "output": output,
+                "argmax": output.argmax(dim=-1),
+                "extra": [output * 2, batch.cpu()],
+                "sparse": output.to_sparse(),
+            }
+
+    model = CustomBoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, gpus=1, limit_predict_batches=3)
+    dataloader = DataLoader(RandomDataset(32, 64), pin_memory=pin_memory)
+    results = trainer.predict(model, dataloaders=dataloader)
+    assert trainer.predict_loop.epoch_loop._pending_copies == {}
+
+    assert len(results) == 3
+    for result in results:
+        output, argmax, (doubled, batch), sparse = result["output"], result["argmax"], result["extra"], result["sparse"]
+        assert all(t.device.type == "cpu" for t in (output, argmax, doubled, batch, sparse))
+        # page-locked memory is only used when the dataloader opts into it
+        assert all(t.is_pinned() == pin_memory for t in (output, argmax, doubled))
+        assert not batch.is_pinned()
+        assert torch.equal(sparse.to_dense(), output)
+        # every prediction owns its memory, so keeping or saving one field does not retain the whole batch
+        assert output.storage().data_ptr() != doubled.storage().data_ptr()
+        assert output.storage().size() == output.numel() and doubled.storage().size() == doubled.numel()
+        assert argmax.dtype == torch.int64
+        assert torch.equal(output.argmax(dim=-1), argmax)
+        assert torch.allclose(output * 2, doubled)
+
+
+@pytest.mark.parametrize("gpus", [None, pytest.param(1, marks=RunIf(min_gpus=1))])
+def test_trainer_predict_single_tensor_fast_path(tmpdir, gpus):
+    """ Test that single tensor predictions are moved to the CPU without walking them as a collection. """
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, gpus=gpus, limit_predict_batches=2)
+    with patch(
+        "pytorch_lightning.loops.epoch.prediction_epoch_loop.apply_to_collection", wraps=apply_to_collection
+    ) as apply_mock:
+        results = trainer.predict(model, dataloaders=model.train_dataloader())
+    apply_mock.assert_not_called()
+
+    assert len(results) == 2
+    assert all(isinstance(r, torch.Tensor) and r.device.type == "cpu" for r in results)
+
+
 @RunIf(skip_windows=True)
 def test_trainer_predict_ddp_cpu(tmpdir):
     predict(tmpdir, "ddp_cpu", 0, 2)
@@ -20,7 +20,7 @@ import numpy as np
 import pytest
 import torch
 
-from pytorch_lightning.utilities.apply_func import apply_to_collection, apply_to_collections
+from pytorch_lightning.utilities.apply_func import _walk_collection, apply_to_collection, apply_to_collections
 
 
 def test_recursive_application_to_collection():
@@ -154,6 +154,30 @@ def test_apply_to_collection_include_none():
     assert reduced == [3.4, 5.6]
 
 
+def test_walk_collection():
+
+    @dataclasses.dataclass
+    class Feature:
+        input_ids: int
+        label: float
+
+    ntc = namedtuple('Foo', ['bar'])
+    collection = {
+        'a': [1, (2.0, 'x')],
+        'b': OrderedDict([('c', 3), ('d', ntc(bar=4.0))]),
+        'e': Feature(input_ids=5, label=6.0),
+        'f': '7',
+        'g': 8,
+    }
+
+    visited = []
+    apply_to_collection(collection, numbers.Number, visited.append)
+    assert list(_walk_collection(collection, numbers.Number)) == visited == [1, 2.0, 3, 4.0, 5, 6.0, 8]
+    assert list(_walk_collection(collection, numbers.Number, wrong_dtype=float)) == [1, 3, 5, 8]
+    assert list(_walk_collection(collection, str)) == ['x', '7']
+    assert list(_walk_collection(collection, torch.Tensor)) == []
+
+
 def test_apply_to_collections():
     to_reduce_1 = {'a': {'b': [1, 2]}, 'c': 5}
     to_reduce_2 = {'a': {'b': [3, 4]}, 'c': 6}